@@ -3,18 +3,22 @@ from __future__ import annotations
 
 import logging
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
 
-from .api import BroadAirApiClient, BroadAirAuthError, BroadAirConnectionError
+from .api import BroadAirApiClient, create_session, get_ssl_context
 from .const import (
     CONF_ACCOUNT,
     CONF_DEVICE_ID,
+    CONF_DEVICE_MAC,
+    CONF_DEVICE_MODEL,
     CONF_DEVICE_NAME,
     CONF_PASSWORD,
     CONF_TOKEN,
+    DATA_SESSION,
     DOMAIN,
 )
 from .coordinator import BroadAirCoordinator
@@ -29,6 +33,41 @@ PLATFORMS: list[Platform] = [
 ]
 
 
+async def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the aiohttp session shared by all Broad Fresh Air entries.
+
+    HA's shared session (async_get_clientsession) drops idle connections
+    after aiohttp's default 15 second keep-alive, well inside the 60 second
+    poll interval, so every poll would redo the TCP and TLS handshake. Our
+    own session uses the connector from create_session, which keeps
+    connections to the API host for 75 seconds, and is closed when Home
+    Assistant shuts down.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Shared aiohttp session
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session: aiohttp.ClientSession | None = domain_data.get(DATA_SESSION)
+    if session is None:
+        # Load the CA bundle off the event loop before building the connector;
+        # another entry may have created the session while we waited
+        await hass.async_add_executor_job(get_ssl_context)
+        session = domain_data.get(DATA_SESSION)
+    if session is None:
+        session = create_session()
+        domain_data[DATA_SESSION] = session
+
+        async def _async_close_session(event: Event) -> None:
+            await session.close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+
+    return session
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Broad Fresh Air from a config entry.
 
@@ -41,32 +80,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
     hass.data.setdefault(DOMAIN, {})
 
-    # Create API client (note: we don't use HA's session due to SSL issues)
+    # Create API client on the integration-wide session
     client = BroadAirApiClient(
         token=entry.data[CONF_TOKEN],
-        session=None,  # Client will create its own session with proper SSL config
+        session=await async_get_session(hass),
         account=entry.data.get(CONF_ACCOUNT),
         password=entry.data.get(CONF_PASSWORD),
     )
 
-    # Validate token on startup
-    try:
-        if not await client.validate_token():
-            raise ConfigEntryAuthFailed("Invalid or expired token")
-    except BroadAirAuthError as err:
-        raise ConfigEntryAuthFailed(str(err)) from err
-    except BroadAirConnectionError as err:
-        raise ConfigEntryNotReady(f"Unable to connect: {err}") from err
-
     # Create coordinator
     coordinator = BroadAirCoordinator(
         hass=hass,
         client=client,
         device_id=entry.data[CONF_DEVICE_ID],
         device_name=entry.data.get(CONF_DEVICE_NAME, "Broad Fresh Air"),
+        device_model=entry.data.get(CONF_DEVICE_MODEL, "FE6-Pro"),
+        device_mac=entry.data.get(CONF_DEVICE_MAC),
     )
 
-    # Fetch initial data
+    # Fetch initial data. This also validates the token: auth failures raise
+    # ConfigEntryAuthFailed and connection failures ConfigEntryNotReady.
+    # It must finish before the platforms are forwarded: a setup that fails
+    # after forwarding leaves loaded platforms behind on retry, and the
+    # platforms read coordinator.data when creating their entities.
     await coordinator.async_config_entry_first_refresh()
 
     # Store coordinator for platforms
@@ -99,7 +135,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: BroadAirCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        # No-op for the shared session; only a client that created its own
+        # session closes it
+        await coordinator.client.close()
         _LOGGER.info(
             "Broad Fresh Air integration unloaded for %s",
             entry.data.get(CONF_DEVICE_NAME, entry.data[CONF_DEVICE_ID]),
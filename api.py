@@ -5,11 +5,13 @@ import asyncio
 import hashlib
 import logging
 import random
+import secrets
 import ssl
 import time
 from typing import Any
 
 import aiohttp
+import orjson
 
 from .const import (
     API_BASE_URL,
@@ -28,6 +30,33 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Response codes that mean the session token was rejected
+_AUTH_CODES: frozenset[int] = frozenset({401, 403, 800, 10001})
+
+# Delay before resending a request after a token refresh (seconds): a random
+# jitter plus a backoff that doubles while retries keep failing
+_RETRY_JITTER: tuple[float, float] = (0.2, 0.8)
+_RETRY_BACKOFF_MIN = 0.5
+_RETRY_BACKOFF_MAX = 30.0
+
+# Speed level -> "cs" argument of the set speed command
+_SPEED_STRS: dict[int, str] = {speed: str(speed) for speed in range(1, 7)}
+
+# (sjx, cs) pairs of every control command, pre-built per bound device
+_CONTROL_COMMANDS: tuple[tuple[str, str], ...] = (
+    (CMD_POLL, ""),
+    (CMD_POWER_ON, ""),
+    (CMD_POWER_OFF, ""),
+    *((CMD_SET_SPEED, cs) for cs in _SPEED_STRS.values()),
+    (CMD_SLEEP_MODE, "1"),
+    (CMD_SLEEP_MODE, "0"),
+    (CMD_RESET_HEPA_FILTER, "1"),
+    (CMD_RESET_COARSE_FILTER, "1"),
+)
+
+# MD5 state primed with the constant AppToken prefix of every Sign
+_BASE_SIGN_MD5 = hashlib.md5(APP_TOKEN.encode())
+
 
 class BroadAirApiError(Exception):
     """Base exception for BroadAir API errors."""
@@ -41,22 +70,31 @@ class BroadAirConnectionError(BroadAirApiError):
     """Connection error."""
 
 
-def _md5(s: str) -> str:
-    """Calculate MD5 hash of string."""
-    return hashlib.md5(s.encode()).hexdigest()
-
-
 def _generate_nonce() -> str:
     """Generate 6-digit random nonce."""
-    return str(random.randint(100000, 999999))
+    return str(secrets.randbelow(900_000) + 100_000)
 
 
 def _generate_sign(nonce: str, timestamp: int) -> str:
     """
     Generate Sign using formula: MD5(AppToken + Nonce + Timestamp)
     """
-    data = f"{APP_TOKEN}{nonce}{timestamp}"
-    return _md5(data)
+    sign = _BASE_SIGN_MD5.copy()
+    sign.update(f"{nonce}{timestamp}".encode())
+    return sign.hexdigest()
+
+
+def _is_auth_error(code: Any, msg: str) -> bool:
+    """Check whether a non-200 response means the token was rejected.
+
+    Known codes are checked first (800 = token验证失败); the message is only
+    scanned for other error codes of 400 and above.
+    """
+    return code in _AUTH_CODES or (
+        isinstance(code, int)
+        and code >= 400
+        and ("token" in msg.lower() or "验证失败" in msg)
+    )
 
 
 def _create_ssl_context() -> ssl.SSLContext:
@@ -67,6 +105,43 @@ def _create_ssl_context() -> ssl.SSLContext:
     return ssl_context
 
 
+_SSL_CONTEXT: ssl.SSLContext | None = None
+
+
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the module-wide SSL context, creating it on first use.
+
+    Creating the context loads the CA bundle from disk, so the first call
+    should happen in an executor (see async_get_session).
+    """
+    global _SSL_CONTEXT  # pylint: disable=global-statement
+    if _SSL_CONTEXT is None:
+        _SSL_CONTEXT = _create_ssl_context()
+    return _SSL_CONTEXT
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create an aiohttp session that keeps connections to the API host alive.
+
+    The connector carries the SSL context, so requests need not pass one.
+
+    Returns:
+        New aiohttp session; the caller is responsible for closing it
+    """
+    connector = aiohttp.TCPConnector(
+        ssl=get_ssl_context(),
+        # Everything goes to the single Broad-Air host; keep a few warm
+        # connections and cache its DNS record
+        limit=8,
+        limit_per_host=4,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+        force_close=False,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
 async def async_login(
     account: str,
     password: str,
@@ -115,13 +190,14 @@ async def async_login(
 
     own_session = session is None
     if own_session:
-        connector = aiohttp.TCPConnector(ssl=_create_ssl_context())
-        session = aiohttp.ClientSession(connector=connector)
+        session = create_session()
 
     try:
         async with asyncio.timeout(30):
-            async with session.post(url, json=payload, headers=headers, ssl=_create_ssl_context()) as resp:
-                result = await resp.json()
+            async with session.post(
+                url, data=orjson.dumps(payload), headers=headers
+            ) as resp:
+                result = orjson.loads(await resp.read())
 
                 _LOGGER.debug("Login response code: %s", result.get("Code"))
 
@@ -136,6 +212,8 @@ async def async_login(
         raise BroadAirConnectionError("Login request timeout") from err
     except aiohttp.ClientError as err:
         raise BroadAirConnectionError(f"Connection error: {err}") from err
+    except orjson.JSONDecodeError as err:
+        raise BroadAirConnectionError(f"Invalid login response: {err}") from err
     finally:
         if own_session and session:
             await session.close()
@@ -155,7 +233,7 @@ class BroadAirApiClient:
 
         Args:
             token: Session token from Data.Token after login
-            session: Optional aiohttp session (recommended to use HA's session)
+            session: Optional shared aiohttp session (see create_session)
             account: Optional account for re-authentication
             password: Optional password for re-authentication
         """
@@ -164,18 +242,52 @@ class BroadAirApiClient:
         self._own_session = session is None
         self._account = account
         self._password = password
-        self._ssl_context = _create_ssl_context()
+        # Request headers are built once; only "token" changes on refresh
+        self._headers: dict[str, str] = {
+            "Content-Type": "application/json",
+            "language": "en",
+            "token": token,
+            "User-Agent": "Mozilla/5.0 (Linux; Android 14) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+            "Connection": "keep-alive",
+        }
+        self._device_id: str | None = None
+        self._payloads: dict[tuple[str, str], dict[str, str]] = {}
+        self._retry_backoff = 0.0
 
     @property
     def token(self) -> str:
         """Return current token."""
         return self._token
 
+    def bind_device(self, device_id: str) -> None:
+        """Pre-build control payloads for the device this client serves.
+
+        Args:
+            device_id: Device GUID (eq_guid)
+        """
+        self._device_id = device_id
+        self._payloads = {
+            (cmd, cs): {"eq_guid": device_id, "sjx": cmd, "cs": cs}
+            for cmd, cs in _CONTROL_COMMANDS
+        }
+
+    def _control_payload(self, device_id: str, cmd: str, cs: str = "") -> dict[str, str]:
+        """Return the control payload, reusing the bound template if possible.
+
+        Templates are shared between calls and must not be modified.
+        """
+        if device_id == self._device_id:
+            payload = self._payloads.get((cmd, cs))
+            if payload is not None:
+                return payload
+        return {"eq_guid": device_id, "sjx": cmd, "cs": cs}
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None:
-            connector = aiohttp.TCPConnector(ssl=self._ssl_context)
-            self._session = aiohttp.ClientSession(connector=connector)
+            self._session = create_session()
         return self._session
 
     async def close(self) -> None:
@@ -184,18 +296,6 @@ class BroadAirApiClient:
             await self._session.close()
             self._session = None
 
-    def _headers(self) -> dict[str, str]:
-        """Build request headers."""
-        return {
-            "Content-Type": "application/json",
-            "language": "en",
-            "token": self._token,
-            "User-Agent": "Mozilla/5.0 (Linux; Android 14) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
-            "Accept": "application/json",
-            "Accept-Encoding": "gzip",
-            "Connection": "keep-alive",
-        }
-
     async def _request(
         self,
         endpoint: str,
@@ -219,60 +319,86 @@ class BroadAirApiClient:
             BroadAirConnectionError: If connection fails
             BroadAirApiError: For other API errors
         """
-        session = await self._get_session()
         url = f"{API_BASE_URL}{endpoint}"
+        body = orjson.dumps(data)
+        # Refresh the token at most once per request
+        can_refresh = retry_auth and bool(self._account and self._password)
 
         _LOGGER.debug("API request to %s: %s", endpoint, data)
 
+        while True:
+            code, result = await self._request_raw(url, body, timeout)
+            if code == 200:
+                self._retry_backoff = 0.0
+                return result.get("Data", {})
+
+            msg = result.get("Message", result.get("Msg", "Unknown error"))
+
+            if not _is_auth_error(code, msg):
+                raise BroadAirApiError(f"API error {code}: {msg}")
+
+            if not can_refresh:
+                raise BroadAirAuthError(
+                    f"Authentication failed (code {code}): {msg}"
+                )
+
+            # Refresh the token; the loop then resends the same body with the
+            # updated headers
+            can_refresh = False
+            _LOGGER.info("Token expired (code %s: %s), attempting to refresh...", code, msg)
+            try:
+                await self.refresh_token()
+            except BroadAirAuthError as refresh_err:
+                _LOGGER.error("Token refresh failed: %s", refresh_err)
+                raise BroadAirAuthError(
+                    f"Authentication failed and token refresh failed: {msg}"
+                ) from refresh_err
+
+            delay = self._retry_backoff + random.uniform(*_RETRY_JITTER)
+            self._retry_backoff = min(
+                max(self._retry_backoff * 2, _RETRY_BACKOFF_MIN), _RETRY_BACKOFF_MAX
+            )
+            _LOGGER.info("Token refreshed successfully, retrying request in %.1fs", delay)
+            await asyncio.sleep(delay)
+
+    async def _request_raw(
+        self,
+        url: str,
+        body: bytes,
+        timeout: int = 30,
+    ) -> tuple[Any, dict[str, Any]]:
+        """Send one API request without interpreting the response code.
+
+        Args:
+            url: Full request URL
+            body: JSON-encoded request body
+            timeout: Request timeout in seconds
+
+        Returns:
+            Tuple of (response Code, full response body)
+
+        Raises:
+            BroadAirConnectionError: If connection fails
+        """
+        session = await self._get_session()
         try:
             async with asyncio.timeout(timeout):
                 async with session.post(
                     url,
-                    json=data,
-                    headers=self._headers(),
-                    ssl=self._ssl_context,
+                    data=body,
+                    headers=self._headers,
                 ) as resp:
-                    result = await resp.json()
-
-                    _LOGGER.debug("API response: %s", result)
-
-                    code = result.get("Code")
-                    if code != 200:
-                        msg = result.get("Message", result.get("Msg", "Unknown error"))
-                        
-                        # Check if it's an auth error (code 800 = token验证失败)
-                        is_auth_error = (
-                            code in (401, 403, 800, 10001) or 
-                            "token" in msg.lower() or 
-                            "验证失败" in msg
-                        )
-                        
-                        if is_auth_error:
-                            # Try to refresh token if we have credentials and haven't retried yet
-                            if retry_auth and self._account and self._password:
-                                _LOGGER.info("Token expired (code %s: %s), attempting to refresh...", code, msg)
-                                try:
-                                    await self.refresh_token()
-                                    _LOGGER.info("Token refreshed successfully, retrying request")
-                                    # Retry the request with new token (but don't retry auth again)
-                                    return await self._request(endpoint, data, timeout, retry_auth=False)
-                                except BroadAirAuthError as refresh_err:
-                                    _LOGGER.error("Token refresh failed: %s", refresh_err)
-                                    raise BroadAirAuthError(
-                                        f"Authentication failed and token refresh failed: {msg}"
-                                    ) from refresh_err
-                            
-                            raise BroadAirAuthError(
-                                f"Authentication failed (code {code}): {msg}"
-                            )
-                        raise BroadAirApiError(f"API error {code}: {msg}")
-
-                    return result.get("Data", {})
-
+                    result = orjson.loads(await resp.read())
         except asyncio.TimeoutError as err:
             raise BroadAirConnectionError(f"Request timeout: {url}") from err
         except aiohttp.ClientError as err:
             raise BroadAirConnectionError(f"Connection error: {err}") from err
+        except orjson.JSONDecodeError as err:
+            raise BroadAirConnectionError(f"Invalid response from {url}: {err}") from err
+
+        _LOGGER.debug("API response: %s", result)
+
+        return result.get("Code"), result
 
     async def refresh_token(self) -> str:
         """Refresh the session token by re-authenticating.
@@ -294,6 +420,7 @@ class BroadAirApiClient:
         if not self._token:
             raise BroadAirAuthError("Login succeeded but no token returned")
 
+        self._headers["token"] = self._token
         return self._token
 
     async def get_devices(self) -> list[dict[str, Any]]:
@@ -318,7 +445,7 @@ class BroadAirApiClient:
         """
         return await self._request(
             ENDPOINT_CONTROL,
-            {"eq_guid": device_id, "sjx": CMD_POLL, "cs": ""},
+            self._control_payload(device_id, CMD_POLL),
         )
 
     async def set_power(self, device_id: str, on: bool) -> dict[str, Any]:
@@ -334,7 +461,7 @@ class BroadAirApiClient:
         cmd = CMD_POWER_ON if on else CMD_POWER_OFF
         return await self._request(
             ENDPOINT_CONTROL,
-            {"eq_guid": device_id, "sjx": cmd, "cs": ""},
+            self._control_payload(device_id, cmd),
         )
 
     async def set_speed(self, device_id: str, speed: int) -> dict[str, Any]:
@@ -350,11 +477,12 @@ class BroadAirApiClient:
         Raises:
             ValueError: If speed is not between 1 and 6
         """
-        if not 1 <= speed <= 6:
+        cs = _SPEED_STRS.get(speed)
+        if cs is None:
             raise ValueError(f"Speed must be between 1 and 6, got {speed}")
         return await self._request(
             ENDPOINT_CONTROL,
-            {"eq_guid": device_id, "sjx": CMD_SET_SPEED, "cs": str(speed)},
+            self._control_payload(device_id, CMD_SET_SPEED, cs),
         )
 
     async def set_sleep_mode(self, device_id: str, on: bool) -> dict[str, Any]:
@@ -369,7 +497,7 @@ class BroadAirApiClient:
         """
         return await self._request(
             ENDPOINT_CONTROL,
-            {"eq_guid": device_id, "sjx": CMD_SLEEP_MODE, "cs": "1" if on else "0"},
+            self._control_payload(device_id, CMD_SLEEP_MODE, "1" if on else "0"),
         )
 
     async def reset_hepa_filter(self, device_id: str) -> dict[str, Any]:
@@ -383,7 +511,7 @@ class BroadAirApiClient:
         """
         return await self._request(
             ENDPOINT_CONTROL,
-            {"eq_guid": device_id, "sjx": CMD_RESET_HEPA_FILTER, "cs": "1"},
+            self._control_payload(device_id, CMD_RESET_HEPA_FILTER, "1"),
         )
 
     async def reset_coarse_filter(self, device_id: str) -> dict[str, Any]:
@@ -397,20 +525,5 @@ class BroadAirApiClient:
         """
         return await self._request(
             ENDPOINT_CONTROL,
-            {"eq_guid": device_id, "sjx": CMD_RESET_COARSE_FILTER, "cs": "1"},
+            self._control_payload(device_id, CMD_RESET_COARSE_FILTER, "1"),
         )
-
-    async def validate_token(self) -> bool:
-        """Validate token by fetching devices.
-
-        Returns:
-            True if token is valid, False otherwise
-        """
-        try:
-            await self.get_devices()
-            return True
-        except BroadAirAuthError:
-            return False
-        except BroadAirApiError:
-            # Other errors don't necessarily mean invalid token
-            return True
@@ -7,7 +7,6 @@ from typing import Any
 from homeassistant.components.button import ButtonDeviceClass, ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -50,15 +49,13 @@ class BroadAirResetHEPAFilterButton(CoordinatorEntity[BroadAirCoordinator], Butt
         self._device_id = entry.data[CONF_DEVICE_ID]
         self._attr_unique_id = f"{self._device_id}_reset_hepa_filter"
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-        )
+        self._attr_device_info = coordinator.device_info
 
     async def async_press(self) -> None:
         """Handle button press - reset HEPA filter timer."""
         _LOGGER.info("Resetting HEPA filter timer for %s", self._device_id)
-        await self.coordinator.client.reset_hepa_filter(self._device_id)
-        await self.coordinator.async_request_refresh()
+        data = await self.coordinator.client.reset_hepa_filter(self._device_id)
+        await self.coordinator.async_apply_command_result(data)
 
 
 class BroadAirResetCoarseFilterButton(CoordinatorEntity[BroadAirCoordinator], ButtonEntity):
@@ -80,12 +77,10 @@ class BroadAirResetCoarseFilterButton(CoordinatorEntity[BroadAirCoordinator], Bu
         self._device_id = entry.data[CONF_DEVICE_ID]
         self._attr_unique_id = f"{self._device_id}_reset_coarse_filter"
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-        )
+        self._attr_device_info = coordinator.device_info
 
     async def async_press(self) -> None:
         """Handle button press - reset coarse filter timer."""
         _LOGGER.info("Resetting coarse filter timer for %s", self._device_id)
-        await self.coordinator.client.reset_coarse_filter(self._device_id)
-        await self.coordinator.async_request_refresh()
+        data = await self.coordinator.client.reset_coarse_filter(self._device_id)
+        await self.coordinator.async_apply_command_result(data)
@@ -10,6 +10,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 
+from . import async_get_session
 from .api import async_login, BroadAirApiClient, BroadAirApiError, BroadAirAuthError
 from .const import (
     CONF_ACCOUNT,
@@ -53,19 +54,18 @@ async def validate_credentials(
         BroadAirAuthError: If login fails
         BroadAirApiError: If connection fails
     """
+    session = await async_get_session(hass)
+
     # Login to get token
-    login_data = await async_login(account, password)
+    login_data = await async_login(account, password, session)
     token = login_data.get("Token")
 
     if not token:
         raise BroadAirAuthError("Login succeeded but no token returned")
 
-    # Get devices using the new token
-    client = BroadAirApiClient(token, account=account, password=password)
-    try:
-        devices = await client.get_devices()
-    finally:
-        await client.close()
+    # Get devices using the new token; the client does not own the session
+    client = BroadAirApiClient(token, session, account=account, password=password)
+    devices = await client.get_devices()
 
     return token, devices
 
@@ -158,13 +158,11 @@ class BroadAirConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
         # Build device options for selection
-        device_options = {
-            d[DEVICE_FIELD_ID]: (
-                f"{d.get(DEVICE_FIELD_NAME, 'Unknown')} "
-                f"({d.get(DEVICE_FIELD_MODEL, 'Unknown Model')})"
-            )
-            for d in self._devices
-        }
+        device_options: dict[str, str] = {}
+        for device in self._devices:
+            name = device.get(DEVICE_FIELD_NAME) or "Unknown"
+            model = device.get(DEVICE_FIELD_MODEL) or "Unknown Model"
+            device_options[device[DEVICE_FIELD_ID]] = f"{name} ({model})"
 
         return self.async_show_form(
             step_id="device",
@@ -4,6 +4,9 @@ from typing import Final
 
 DOMAIN: Final = "broadair"
 
+# hass.data[DOMAIN] key for the integration-wide aiohttp session
+DATA_SESSION: Final = "session"
+
 # API Configuration
 API_HOST: Final = "broadair.remotcon.mobi"
 API_PORT: Final = 8201
@@ -28,6 +31,11 @@ CMD_RESET_COARSE_FILTER: Final = "9"
 
 # Defaults
 DEFAULT_SCAN_INTERVAL: Final = timedelta(seconds=60)
+IDLE_SCAN_INTERVAL: Final = timedelta(seconds=300)  # powered off and unchanged
+FAST_SCAN_INTERVAL: Final = timedelta(seconds=15)  # right after a command
+IDLE_POLLS_BEFORE_SLOWDOWN: Final = 3
+FAST_POLLS_AFTER_COMMAND: Final = 2
+REQUEST_REFRESH_COOLDOWN: Final = 1.0  # seconds to coalesce requested refreshes
 FAN_SPEED_COUNT: Final = 6
 
 # Config keys
@@ -2,18 +2,136 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import (
+    CONNECTION_NETWORK_MAC,
+    DeviceInfo,
+    format_mac,
+)
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import BroadAirApiClient, BroadAirApiError, BroadAirAuthError
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    FAST_POLLS_AFTER_COMMAND,
+    FAST_SCAN_INTERVAL,
+    FIELD_AIR_VOLUME,
+    FIELD_CO2,
+    FIELD_CO2_MODULE,
+    FIELD_COARSE_USED_TIME,
+    FIELD_DUST_MODULE,
+    FIELD_FAULT,
+    FIELD_GEAR,
+    FIELD_HEPA_LIFE_CYCLE,
+    FIELD_HEPA_USED_TIME,
+    FIELD_PM_2_5,
+    FIELD_PM_10,
+    FIELD_POWER,
+    FIELD_ROOM_TEMP,
+    FIELD_RUNNING_GEAR,
+    FIELD_TEMP_MODULE,
+    IDLE_POLLS_BEFORE_SLOWDOWN,
+    IDLE_SCAN_INTERVAL,
+    REQUEST_REFRESH_COOLDOWN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def get_int_value(data: dict[str, Any], field: str) -> int | None:
+    """Get integer value from data."""
+    value = data.get(field)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def get_fault_index(data: dict[str, Any]) -> int | None:
+    """Get the numeric fault code, 0 if none is reported, None if unparsable."""
+    if FIELD_FAULT not in data:
+        return 0
+    return get_int_value(data, FIELD_FAULT)
+
+
+def get_filter_percentage(used: int | None, total: int | None) -> int | None:
+    """Calculate filter remaining percentage from parsed hours."""
+    if used is None or total is None or total <= 0:
+        return None
+    if used >= total:
+        return 0
+    return 100 - used * 100 // total
+
+
+@dataclass(frozen=True, slots=True)
+class BroadAirStatus:
+    """Sensor values parsed once from a device status dictionary."""
+
+    air_volume: int | None
+    gear: int | None
+    fault_code: str
+    fault_index: int | None
+    hepa_used_time: int | None
+    hepa_life_cycle: int | None
+    hepa_filter_percentage: int | None
+    coarse_used_time: int | None
+    co2: int | None
+    pm25: int | None
+    pm10: int | None
+    room_temperature: int | None
+    co2_module: bool
+    dust_module: bool
+    temperature_module: bool
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> BroadAirStatus:
+        """Parse a device status dictionary.
+
+        Args:
+            data: Status dictionary returned by the API
+
+        Returns:
+            Parsed status
+        """
+        hepa_used_time = get_int_value(data, FIELD_HEPA_USED_TIME)
+        hepa_life_cycle = get_int_value(data, FIELD_HEPA_LIFE_CYCLE)
+        return cls(
+            air_volume=get_int_value(data, FIELD_AIR_VOLUME),
+            gear=(
+                get_int_value(data, FIELD_GEAR)
+                or get_int_value(data, FIELD_RUNNING_GEAR)
+            ),
+            fault_code=data.get(FIELD_FAULT, "00"),
+            fault_index=get_fault_index(data),
+            hepa_used_time=hepa_used_time,
+            hepa_life_cycle=hepa_life_cycle,
+            hepa_filter_percentage=get_filter_percentage(
+                hepa_used_time, hepa_life_cycle
+            ),
+            coarse_used_time=get_int_value(data, FIELD_COARSE_USED_TIME),
+            co2=get_int_value(data, FIELD_CO2),
+            pm25=get_int_value(data, FIELD_PM_2_5),
+            pm10=get_int_value(data, FIELD_PM_10),
+            room_temperature=get_int_value(data, FIELD_ROOM_TEMP),
+            co2_module=data.get(FIELD_CO2_MODULE) == "1",
+            dust_module=data.get(FIELD_DUST_MODULE) == "1",
+            temperature_module=data.get(FIELD_TEMP_MODULE) == "1",
+        )
+
+    @property
+    def has_fault(self) -> bool:
+        """Return True unless the device reports fault code 0."""
+        return self.fault_index != 0
+
+
 class BroadAirCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for Broad Fresh Air data updates."""
 
@@ -23,6 +141,8 @@ class BroadAirCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         client: BroadAirApiClient,
         device_id: str,
         device_name: str,
+        device_model: str,
+        device_mac: str | None = None,
     ) -> None:
         """Initialize coordinator.
 
@@ -30,18 +150,59 @@ class BroadAirCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass: Home Assistant instance
             client: API client instance
             device_id: Device GUID
-            device_name: Device name for logging
+            device_name: Device name for logging and the device registry
+            device_model: Device model for the device registry
+            device_mac: Optional device MAC address
         """
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{device_name}",
             update_interval=DEFAULT_SCAN_INTERVAL,
+            # Skip entity updates when a poll returns the same status
+            always_update=False,
+            # Collapse back-to-back refresh requests (e.g. pressing both
+            # filter reset buttons) into a single status poll
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
         self.client = client
+        self.client.bind_device(device_id)
         self.device_id = device_id
         self.device_name = device_name
 
+        # Device registry info shared by every entity of this device
+        self.device_info = DeviceInfo(
+            identifiers=frozenset({(DOMAIN, device_id)}),
+            name=device_name,
+            manufacturer="Broad",
+            model=device_model,
+        )
+        if device_mac:
+            self.device_info["connections"] = frozenset(
+                {(CONNECTION_NETWORK_MAC, format_mac(device_mac))}
+            )
+        self._previous_data: dict[str, Any] | None = None
+        self._unchanged_polls = 0
+        self._fast_polls = 0
+        self._command_refresh = False
+        self._status: BroadAirStatus | None = None
+        self._status_source: dict[str, Any] | None = None
+
+    @property
+    def status(self) -> BroadAirStatus | None:
+        """Return the latest data parsed for sensors, parsing it at most once."""
+        if self.data is None:
+            return None
+        if self._status_source is not self.data:
+            self._status = BroadAirStatus.from_data(self.data)
+            self._status_source = self.data
+        return self._status
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API.
 
@@ -54,13 +215,15 @@ class BroadAirCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         try:
             data = await self.client.get_status(self.device_id)
-            _LOGGER.debug(
-                "Updated data for %s: power=%s, gear=%s, sleep=%s",
-                self.device_name,
-                data.get("FB_ON"),
-                data.get("GEAR_POSITION"),
-                data.get("FB_SLEEPMODEL_ON"),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Updated data for %s: power=%s, gear=%s, sleep=%s",
+                    self.device_name,
+                    data.get("FB_ON"),
+                    data.get("GEAR_POSITION"),
+                    data.get("FB_SLEEPMODEL_ON"),
+                )
+            self._adjust_update_interval(data)
             return data
         except BroadAirAuthError as err:
             # Auth error means auto-refresh also failed
@@ -70,6 +233,81 @@ class BroadAirCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "Please reconfigure the integration with valid credentials."
             ) from err
         except BroadAirApiError as err:
+            # Don't keep fast polling through an outage
+            self._command_refresh = False
+            if self._fast_polls:
+                self._fast_polls = 0
+                self.update_interval = DEFAULT_SCAN_INTERVAL
             raise UpdateFailed(
                 f"Error fetching data for {self.device_name}: {err}"
             ) from err
+
+    def _adjust_update_interval(self, data: dict[str, Any]) -> None:
+        """Adapt the polling interval to device activity.
+
+        Polls quickly for a couple of updates after a command, slows down
+        once a powered-off device without faults stops changing, and uses
+        the default interval otherwise.
+
+        Args:
+            data: Freshly fetched device status
+        """
+        if data == self._previous_data:
+            self._unchanged_polls += 1
+        else:
+            self._unchanged_polls = 0
+        self._previous_data = data
+
+        if self._command_refresh:
+            # Refreshes requested by a command don't use up a fast poll
+            self._command_refresh = False
+        elif self._fast_polls:
+            self._fast_polls -= 1
+        if self._fast_polls:
+            return
+
+        if (
+            data.get(FIELD_POWER) == "0"
+            and get_fault_index(data) == 0
+            and self._unchanged_polls >= IDLE_POLLS_BEFORE_SLOWDOWN
+        ):
+            self.update_interval = IDLE_SCAN_INTERVAL
+        else:
+            self.update_interval = DEFAULT_SCAN_INTERVAL
+
+    @callback
+    def async_set_optimistic(self, updates: dict[str, Any]) -> None:
+        """Show the expected result of a command before the device confirms it.
+
+        Args:
+            updates: Status fields to override until the next update
+        """
+        if self.data is None:
+            return
+
+        self.async_set_updated_data({**self.data, **updates})
+
+    async def async_apply_command_result(self, data: dict[str, Any]) -> None:
+        """Publish the status returned by a control command.
+
+        Control commands answer with the updated device status, so it is
+        pushed to entities directly instead of polling again. Falls back to
+        a refresh when the response carries no status.
+
+        Args:
+            data: Response Data field of the control command
+        """
+        # Watch the state transition closely for the next few polls
+        self._fast_polls = FAST_POLLS_AFTER_COMMAND
+        self.update_interval = FAST_SCAN_INTERVAL
+
+        if not isinstance(data, dict) or not data:
+            await self.async_request_command_refresh()
+            return
+
+        self.async_set_updated_data({**(self.data or {}), **data})
+
+    async def async_request_command_refresh(self) -> None:
+        """Request a refresh after a command without using up a fast poll."""
+        self._command_refresh = True
+        await self.async_request_refresh()
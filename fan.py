@@ -2,20 +2,17 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .api import BroadAirApiError
 from .const import (
     CONF_DEVICE_ID,
-    CONF_DEVICE_MAC,
-    CONF_DEVICE_MODEL,
-    CONF_DEVICE_NAME,
     DOMAIN,
     FAN_SPEED_COUNT,
     FIELD_GEAR,
@@ -27,7 +24,13 @@ from .coordinator import BroadAirCoordinator
 _LOGGER = logging.getLogger(__name__)
 
 # Preset modes for gear 1-6
-PRESET_MODES = ["1", "2", "3", "4", "5", "6"]
+PRESET_MODES: Final = ("1", "2", "3", "4", "5", "6")
+_PRESET_MODE_SET: Final = frozenset(PRESET_MODES)
+
+# Gear -> speed percentage (17, 33, 50, 67, 83, 100)
+_GEAR_TO_PCT: Final = {
+    gear: round(int(gear) * 100 / FAN_SPEED_COUNT) for gear in PRESET_MODES
+}
 
 
 async def async_setup_entry(
@@ -43,6 +46,8 @@ async def async_setup_entry(
 class BroadAirFan(CoordinatorEntity[BroadAirCoordinator], FanEntity):
     """Representation of a Broad Fresh Air fan."""
 
+    __slots__ = ("_device_id", "_is_on", "_preset_mode", "_percentage")
+
     _attr_has_entity_name = True
     _attr_name = None  # Use device name as entity name
     _attr_supported_features = (
@@ -52,7 +57,7 @@ class BroadAirFan(CoordinatorEntity[BroadAirCoordinator], FanEntity):
         | FanEntityFeature.TURN_OFF
     )
     _attr_speed_count = FAN_SPEED_COUNT
-    _attr_preset_modes = PRESET_MODES
+    _attr_preset_modes = list(PRESET_MODES)
 
     def __init__(
         self,
@@ -66,63 +71,53 @@ class BroadAirFan(CoordinatorEntity[BroadAirCoordinator], FanEntity):
         self._attr_unique_id = f"{self._device_id}_fan"
 
         # Device info for device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-            name=entry.data.get(CONF_DEVICE_NAME, "Broad Fresh Air"),
-            manufacturer="Broad",
-            model=entry.data.get(CONF_DEVICE_MODEL, "FE6-Pro"),
-        )
+        self._attr_device_info = coordinator.device_info
+
+        self._is_on: bool | None = None
+        self._preset_mode: str | None = None
+        self._percentage: int | None = 0
+        self._update_cached_state()
+
+    def _update_cached_state(self) -> None:
+        """Compute power, preset and percentage once per coordinator update."""
+        data = self.coordinator.data
+        if data is None:
+            self._is_on = None
+            self._preset_mode = None
+            self._percentage = 0
+            return
+
+        self._is_on = data.get(FIELD_POWER) == "1"
+        gear = data.get(FIELD_GEAR) or data.get(FIELD_RUNNING_GEAR)
+        self._preset_mode = gear if gear in _PRESET_MODE_SET else None
+
+        if not self._is_on:
+            self._percentage = 0
+        else:
+            self._percentage = _GEAR_TO_PCT.get(gear)
+            if self._percentage is None and gear is not None:
+                _LOGGER.warning("Invalid gear value: %s", gear)
 
-        # Add MAC address if available
-        mac = entry.data.get(CONF_DEVICE_MAC)
-        if mac:
-            self._attr_device_info["connections"] = {("mac", mac)}
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
     @property
     def is_on(self) -> bool | None:
         """Return true if fan is on."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get(FIELD_POWER) == "1"
+        return self._is_on
 
     @property
     def preset_mode(self) -> str | None:
         """Return the current preset mode (gear 1-6)."""
-        if self.coordinator.data is None:
-            return None
-
-        gear = self.coordinator.data.get(FIELD_GEAR) or self.coordinator.data.get(
-            FIELD_RUNNING_GEAR
-        )
-
-        if gear and gear in PRESET_MODES:
-            return gear
-
-        return None
+        return self._preset_mode
 
     @property
     def percentage(self) -> int | None:
         """Return the current speed percentage."""
-        if not self.is_on:
-            return 0
-
-        if self.coordinator.data is None:
-            return None
-
-        gear = self.coordinator.data.get(FIELD_GEAR) or self.coordinator.data.get(
-            FIELD_RUNNING_GEAR
-        )
-
-        if gear is None:
-            return None
-
-        try:
-            gear_int = int(gear)
-            # Convert 1-6 to percentage (17, 33, 50, 67, 83, 100)
-            return round(gear_int * 100 / FAN_SPEED_COUNT)
-        except (ValueError, TypeError):
-            _LOGGER.warning("Invalid gear value: %s", gear)
-            return None
+        return self._percentage
 
     async def async_turn_on(
         self,
@@ -138,27 +133,32 @@ class BroadAirFan(CoordinatorEntity[BroadAirCoordinator], FanEntity):
             preset_mode,
         )
 
-        # Send power on command
-        await self.coordinator.client.set_power(self._device_id, True)
-
+        speed: int | None = None
         # If preset_mode specified, set the gear
-        if preset_mode is not None and preset_mode in PRESET_MODES:
+        if preset_mode is not None and preset_mode in _PRESET_MODE_SET:
             speed = int(preset_mode)
-            await self.coordinator.client.set_speed(self._device_id, speed)
         # If percentage specified, convert to gear and set
         elif percentage is not None and percentage > 0:
             speed = max(1, min(6, round(percentage * FAN_SPEED_COUNT / 100)))
-            await self.coordinator.client.set_speed(self._device_id, speed)
         # Otherwise, device remembers its last gear, no need to set it
 
-        await self.coordinator.async_request_refresh()
+        # The API has no combined power+speed command and the gear must be set
+        # after powering on, so skip the power command if already running
+        await self._async_power_on(speed is None or not self.is_on, speed)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the fan."""
         _LOGGER.debug("Turning off fan %s", self._device_id)
 
-        await self.coordinator.client.set_power(self._device_id, False)
-        await self.coordinator.async_request_refresh()
+        self.coordinator.async_set_optimistic({FIELD_POWER: "0"})
+        try:
+            data = await self.coordinator.client.set_power(self._device_id, False)
+        except BroadAirApiError:
+            # Drop the optimistic state
+            await self.coordinator.async_request_command_refresh()
+            raise
+
+        await self.coordinator.async_apply_command_result(data)
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
@@ -175,25 +175,42 @@ class BroadAirFan(CoordinatorEntity[BroadAirCoordinator], FanEntity):
         _LOGGER.debug("Converted percentage %d to gear %d", percentage, speed)
 
         # If fan is off, turn it on first
-        if not self.is_on:
-            await self.coordinator.client.set_power(self._device_id, True)
-
-        await self.coordinator.client.set_speed(self._device_id, speed)
-        await self.coordinator.async_request_refresh()
+        await self._async_power_on(not self.is_on, speed)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode (gear 1-6)."""
         _LOGGER.debug("Setting fan %s preset mode to %s", self._device_id, preset_mode)
 
-        if preset_mode not in PRESET_MODES:
+        if preset_mode not in _PRESET_MODE_SET:
             _LOGGER.error("Invalid preset mode: %s", preset_mode)
             return
 
         speed = int(preset_mode)
 
         # If fan is off, turn it on first
-        if not self.is_on:
-            await self.coordinator.client.set_power(self._device_id, True)
+        await self._async_power_on(not self.is_on, speed)
+
+    async def _async_power_on(self, send_power: bool, speed: int | None) -> None:
+        """Turn the fan on and/or set its gear, showing the result optimistically.
 
-        await self.coordinator.client.set_speed(self._device_id, speed)
-        await self.coordinator.async_request_refresh()
+        Args:
+            send_power: Whether to send the power on command
+            speed: Gear 1-6 to set, or None to keep the current gear
+        """
+        optimistic = {FIELD_POWER: "1"}
+        if speed is not None:
+            optimistic[FIELD_GEAR] = str(speed)
+        self.coordinator.async_set_optimistic(optimistic)
+
+        data: dict[str, Any] = {}
+        try:
+            if send_power:
+                data = await self.coordinator.client.set_power(self._device_id, True)
+            if speed is not None:
+                data = await self.coordinator.client.set_speed(self._device_id, speed)
+        except BroadAirApiError:
+            # Drop the optimistic state
+            await self.coordinator.async_request_command_refresh()
+            raise
+
+        await self.coordinator.async_apply_command_result(data)
@@ -18,74 +18,120 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (
-    CONF_DEVICE_ID,
-    DOMAIN,
-    FIELD_AIR_VOLUME,
-    FIELD_CO2,
-    FIELD_CO2_MODULE,
-    FIELD_COARSE_USED_TIME,
-    FIELD_DUST_MODULE,
-    FIELD_FAULT,
-    FIELD_GEAR,
-    FIELD_HEPA_LIFE_CYCLE,
-    FIELD_HEPA_USED_TIME,
-    FIELD_PM_2_5,
-    FIELD_PM_10,
-    FIELD_ROOM_TEMP,
-    FIELD_RUNNING_GEAR,
-    FIELD_TEMP_MODULE,
-)
-from .coordinator import BroadAirCoordinator
+from .const import CONF_DEVICE_ID, DOMAIN
+from .coordinator import BroadAirCoordinator, BroadAirStatus
 
 _LOGGER = logging.getLogger(__name__)
 
-# Known fault codes (expand as you discover more)
-FAULT_CODES = {
-    "00": "No Fault",
-    "01": "Filter Replacement Required",
+# Known fault descriptions indexed by numeric fault code (expand as you
+# discover more; use None for gaps)
+FAULT_CODES: tuple[str | None, ...] = (
+    "No Fault",  # 00
+    "Filter Replacement Required",  # 01
     # Add more fault codes as discovered
-}
+)
 
 
 @dataclass(frozen=True)
 class BroadAirSensorEntityDescription(SensorEntityDescription):
     """Describes a Broad Air sensor entity."""
 
-    value_fn: Callable[[dict], str | int | float | None] | None = None
-    available_fn: Callable[[dict], bool] | None = None
-    attr_fn: Callable[[dict], dict] | None = None
+    value_fn: Callable[[BroadAirStatus], str | int | float | None] | None = None
+    available_fn: Callable[[BroadAirStatus], bool] | None = None
+    attr_fn: Callable[[BroadAirStatus], dict] | None = None
 
 
-def get_int_value(data: dict, field: str) -> int | None:
-    """Get integer value from data."""
-    value = data.get(field)
-    if value is None:
-        return None
-    try:
-        return int(value)
-    except (ValueError, TypeError):
-        return None
+def get_fault_status(status: BroadAirStatus) -> str:
+    """Get fault description, formatting unknown codes only on a miss."""
+    index = status.fault_index
+    name = (
+        FAULT_CODES[index]
+        if index is not None and 0 <= index < len(FAULT_CODES)
+        else None
+    )
+    return name or f"Unknown ({status.fault_code})"
 
 
-def get_filter_percentage(data: dict, used_field: str, total_field: str) -> int | None:
-    """Calculate filter remaining percentage."""
-    used = get_int_value(data, used_field)
-    total = get_int_value(data, total_field)
-    if used is None or total is None or total == 0:
-        return None
-    remaining = max(0, 100 - (used * 100 // total))
-    return remaining
+def get_fault_attributes(status: BroadAirStatus) -> dict:
+    """Get fault code attributes."""
+    return {"fault_code": status.fault_code, "has_fault": status.has_fault}
+
+
+def _value_air_volume(status: BroadAirStatus) -> int | None:
+    """Get air volume."""
+    return status.air_volume
+
+
+def _value_speed_level(status: BroadAirStatus) -> int | None:
+    """Get speed level, falling back to the running gear."""
+    return status.gear
+
+
+def _attr_speed_level(status: BroadAirStatus) -> dict:
+    """Get speed level range attributes."""
+    return {"min_level": 1, "max_level": 6}
+
+
+def _value_hepa_filter_life(status: BroadAirStatus) -> int | None:
+    """Get HEPA filter remaining life percentage."""
+    return status.hepa_filter_percentage
+
+
+def _attr_hepa_filter_life(status: BroadAirStatus) -> dict:
+    """Get HEPA filter used and total hours."""
+    return {
+        "used_hours": status.hepa_used_time,
+        "total_hours": status.hepa_life_cycle,
+    }
+
+
+def _value_hepa_filter_used(status: BroadAirStatus) -> int | None:
+    """Get HEPA filter used time."""
+    return status.hepa_used_time
+
+
+def _value_coarse_filter_used(status: BroadAirStatus) -> int | None:
+    """Get coarse filter used time."""
+    return status.coarse_used_time
+
+
+def _value_co2(status: BroadAirStatus) -> int | None:
+    """Get CO2 concentration."""
+    return status.co2
+
+
+def _value_pm25(status: BroadAirStatus) -> int | None:
+    """Get PM2.5 concentration."""
+    return status.pm25
+
+
+def _value_pm10(status: BroadAirStatus) -> int | None:
+    """Get PM10 concentration."""
+    return status.pm10
 
 
-def is_module_installed(data: dict, module_field: str) -> bool:
-    """Check if a module is installed."""
-    return data.get(module_field) == "1"
+def _value_temperature(status: BroadAirStatus) -> int | None:
+    """Get room temperature."""
+    return status.room_temperature
+
+
+def _has_co2_module(status: BroadAirStatus) -> bool:
+    """Check if the CO2 module is installed."""
+    return status.co2_module
+
+
+def _has_dust_module(status: BroadAirStatus) -> bool:
+    """Check if the dust module is installed."""
+    return status.dust_module
+
+
+def _has_temp_module(status: BroadAirStatus) -> bool:
+    """Check if the temperature module is installed."""
+    return status.temperature_module
 
 
 SENSOR_DESCRIPTIONS: tuple[BroadAirSensorEntityDescription, ...] = (
@@ -97,25 +143,22 @@ SENSOR_DESCRIPTIONS: tuple[BroadAirSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="m³/h",
         suggested_display_precision=0,
-        value_fn=lambda data: get_int_value(data, FIELD_AIR_VOLUME),
+        value_fn=_value_air_volume,
     ),
     BroadAirSensorEntityDescription(
         key="speed_level",
         name="Speed Level",
         icon="mdi:speedometer",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: get_int_value(data, FIELD_GEAR) or get_int_value(data, FIELD_RUNNING_GEAR),
-        attr_fn=lambda data: {"min_level": 1, "max_level": 6},
+        value_fn=_value_speed_level,
+        attr_fn=_attr_speed_level,
     ),
     BroadAirSensorEntityDescription(
         key="fault_status",
         name="Fault Status",
         icon="mdi:alert-circle-outline",
-        value_fn=lambda data: FAULT_CODES.get(data.get(FIELD_FAULT, "00"), f"Unknown ({data.get(FIELD_FAULT)})"),
-        attr_fn=lambda data: {
-            "fault_code": data.get(FIELD_FAULT, "00"),
-            "has_fault": data.get(FIELD_FAULT, "00") != "00",
-        },
+        value_fn=get_fault_status,
+        attr_fn=get_fault_attributes,
     ),
     # Filter life sensors
     BroadAirSensorEntityDescription(
@@ -124,11 +167,8 @@ SENSOR_DESCRIPTIONS: tuple[BroadAirSensorEntityDescription, ...] = (
         icon="mdi:air-filter",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: get_filter_percentage(data, FIELD_HEPA_USED_TIME, FIELD_HEPA_LIFE_CYCLE),
-        attr_fn=lambda data: {
-            "used_hours": get_int_value(data, FIELD_HEPA_USED_TIME),
-            "total_hours": get_int_value(data, FIELD_HEPA_LIFE_CYCLE),
-        },
+        value_fn=_value_hepa_filter_life,
+        attr_fn=_attr_hepa_filter_life,
     ),
     BroadAirSensorEntityDescription(
         key="hepa_filter_used",
@@ -136,7 +176,7 @@ SENSOR_DESCRIPTIONS: tuple[BroadAirSensorEntityDescription, ...] = (
         icon="mdi:clock-outline",
         native_unit_of_measurement=UnitOfTime.HOURS,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: get_int_value(data, FIELD_HEPA_USED_TIME),
+        value_fn=_value_hepa_filter_used,
         entity_registry_enabled_default=False,  # Disabled by default, advanced users can enable
     ),
     BroadAirSensorEntityDescription(
@@ -145,7 +185,7 @@ SENSOR_DESCRIPTIONS: tuple[BroadAirSensorEntityDescription, ...] = (
         icon="mdi:clock-outline",
         native_unit_of_measurement=UnitOfTime.HOURS,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda data: get_int_value(data, FIELD_COARSE_USED_TIME),
+        value_fn=_value_coarse_filter_used,
         entity_registry_enabled_default=False,
     ),
     # Air quality sensors (only if modules installed)
@@ -156,8 +196,8 @@ SENSOR_DESCRIPTIONS: tuple[BroadAirSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.CO2,
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: get_int_value(data, FIELD_CO2),
-        available_fn=lambda data: is_module_installed(data, FIELD_CO2_MODULE),
+        value_fn=_value_co2,
+        available_fn=_has_co2_module,
     ),
     BroadAirSensorEntityDescription(
         key="pm25",
@@ -166,8 +206,8 @@ SENSOR_DESCRIPTIONS: tuple[BroadAirSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PM25,
         native_unit_of_measurement="µg/m³",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: get_int_value(data, FIELD_PM_2_5),
-        available_fn=lambda data: is_module_installed(data, FIELD_DUST_MODULE),
+        value_fn=_value_pm25,
+        available_fn=_has_dust_module,
     ),
     BroadAirSensorEntityDescription(
         key="pm10",
@@ -176,8 +216,8 @@ SENSOR_DESCRIPTIONS: tuple[BroadAirSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PM10,
         native_unit_of_measurement="µg/m³",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: get_int_value(data, FIELD_PM_10),
-        available_fn=lambda data: is_module_installed(data, FIELD_DUST_MODULE),
+        value_fn=_value_pm10,
+        available_fn=_has_dust_module,
     ),
     BroadAirSensorEntityDescription(
         key="temperature",
@@ -186,12 +226,40 @@ SENSOR_DESCRIPTIONS: tuple[BroadAirSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: get_int_value(data, FIELD_ROOM_TEMP),
-        available_fn=lambda data: is_module_installed(data, FIELD_TEMP_MODULE),
+        value_fn=_value_temperature,
+        available_fn=_has_temp_module,
     ),
 )
 
 
+def _icon_fault_status(sensor: BroadAirSensor) -> str | None:
+    """Get fault status icon."""
+    status = sensor.coordinator.status
+    if status is None:
+        return sensor.entity_description.icon
+    if status.has_fault:
+        return "mdi:alert-circle"
+    return "mdi:check-circle-outline"
+
+
+def _icon_hepa_filter_life(sensor: BroadAirSensor) -> str | None:
+    """Get HEPA filter life icon."""
+    value = sensor.native_value
+    if value is not None:
+        if value <= 10:
+            return "mdi:air-filter-off"
+        if value <= 30:
+            return "mdi:air-filter"
+    return sensor.entity_description.icon
+
+
+# Sensor key -> dynamic icon handler
+_ICON_OVERRIDES: dict[str, Callable[[BroadAirSensor], str | None]] = {
+    "fault_status": _icon_fault_status,
+    "hepa_filter_life": _icon_hepa_filter_life,
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -200,9 +268,14 @@ async def async_setup_entry(
     """Set up Broad Fresh Air sensor entities from config entry."""
     coordinator: BroadAirCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    # Skip sensors whose module is not installed; reloading the entry picks
+    # up modules installed later
+    status = coordinator.status
     entities = [
         BroadAirSensor(coordinator, entry, description)
         for description in SENSOR_DESCRIPTIONS
+        if description.available_fn is None
+        or (status is not None and description.available_fn(status))
     ]
 
     async_add_entities(entities)
@@ -211,6 +284,13 @@ async def async_setup_entry(
 class BroadAirSensor(CoordinatorEntity[BroadAirCoordinator], SensorEntity):
     """Representation of a Broad Fresh Air sensor."""
 
+    __slots__ = (
+        "_device_id",
+        "_module_available",
+        "_cached_value",
+        "_cached_icon",
+    )
+
     _attr_has_entity_name = True
     entity_description: BroadAirSensorEntityDescription
 
@@ -234,61 +314,65 @@ class BroadAirSensor(CoordinatorEntity[BroadAirCoordinator], SensorEntity):
         self._attr_unique_id = f"{self._device_id}_{description.key}"
 
         # Link to the same device as the fan
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-        )
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if not super().available:
-            return False
+        self._module_available = True
+        self._cached_value: str | int | float | None = None
+        self._cached_icon: str | None = description.icon
+        self._update_cached_state()
+
+    def _update_cached_state(self) -> None:
+        """Compute availability, value and icon once per coordinator update."""
+        status = self.coordinator.status
+        description = self.entity_description
 
         # Check module-specific availability
-        if self.entity_description.available_fn and self.coordinator.data:
-            return self.entity_description.available_fn(self.coordinator.data)
+        self._module_available = True
+        if description.available_fn and status is not None:
+            self._module_available = description.available_fn(status)
+
+        if status is None or description.value_fn is None or not self._module_available:
+            self._cached_value = None
+        else:
+            self._cached_value = description.value_fn(status)
+        self._cached_icon = self._compute_icon()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
 
-        return True
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return super().available and self._module_available
 
     @property
     def native_value(self) -> str | int | float | None:
         """Return the sensor value."""
-        if self.coordinator.data is None:
-            return None
-
-        if self.entity_description.value_fn:
-            return self.entity_description.value_fn(self.coordinator.data)
-
-        return None
+        return self._cached_value
 
     @property
     def extra_state_attributes(self) -> dict | None:
         """Return additional state attributes."""
-        if self.coordinator.data is None:
+        status = self.coordinator.status
+        if status is None or not self._module_available:
             return None
 
         if self.entity_description.attr_fn:
-            return self.entity_description.attr_fn(self.coordinator.data)
+            return self.entity_description.attr_fn(status)
 
         return None
 
     @property
     def icon(self) -> str | None:
         """Return dynamic icon based on state."""
-        # Special handling for fault status icon
-        if self.entity_description.key == "fault_status" and self.coordinator.data:
-            fault_code = self.coordinator.data.get(FIELD_FAULT, "00")
-            if fault_code != "00":
-                return "mdi:alert-circle"
-            return "mdi:check-circle-outline"
-
-        # Special handling for filter life icon
-        if self.entity_description.key == "hepa_filter_life":
-            value = self.native_value
-            if value is not None:
-                if value <= 10:
-                    return "mdi:air-filter-off"
-                elif value <= 30:
-                    return "mdi:air-filter"
+        return self._cached_icon
 
+    def _compute_icon(self) -> str | None:
+        """Compute dynamic icon based on state."""
+        handler = _ICON_OVERRIDES.get(self.entity_description.key)
+        if handler is not None:
+            return handler(self)
         return self.entity_description.icon
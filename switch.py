@@ -8,7 +8,6 @@ from typing import Any, Callable
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -74,6 +73,8 @@ async def async_setup_entry(
 class BroadAirSleepSwitch(CoordinatorEntity[BroadAirCoordinator], SwitchEntity):
     """Representation of the sleep mode switch."""
 
+    __slots__ = ("_device_id",)
+
     _attr_has_entity_name = True
     _attr_name = "Sleep Mode"
     _attr_icon = "mdi:sleep"
@@ -96,9 +97,7 @@ class BroadAirSleepSwitch(CoordinatorEntity[BroadAirCoordinator], SwitchEntity):
         self._attr_unique_id = f"{self._device_id}_sleep_mode"
 
         # Link to the same device as the fan
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._device_id)},
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool | None:
@@ -121,12 +120,12 @@ class BroadAirSleepSwitch(CoordinatorEntity[BroadAirCoordinator], SwitchEntity):
         """Turn on sleep mode."""
         _LOGGER.debug("Enabling sleep mode for %s", self._device_id)
 
-        await self.coordinator.client.set_sleep_mode(self._device_id, True)
-        await self.coordinator.async_request_refresh()
+        data = await self.coordinator.client.set_sleep_mode(self._device_id, True)
+        await self.coordinator.async_apply_command_result(data)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off sleep mode."""
         _LOGGER.debug("Disabling sleep mode for %s", self._device_id)
 
-        await self.coordinator.client.set_sleep_mode(self._device_id, False)
-        await self.coordinator.async_request_refresh()
+        data = await self.coordinator.client.set_sleep_mode(self._device_id, False)
+        await self.coordinator.async_apply_command_result(data)